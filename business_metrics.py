@@ -9,6 +9,199 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
+from functools import cached_property
+
+
+# Delivery time buckets: [0, 3], (3, 7], (7, 14], (14, 30], (30, inf)
+DELIVERY_BUCKET_EDGES = np.array([3, 7, 14, 30])
+DELIVERY_BUCKET_LABELS = ['1-3 days', '4-7 days', '8-14 days', '15-30 days', '30+ days']
+
+# String group keys that are dictionary-encoded once per calculator
+CATEGORICAL_COLUMNS = (
+    'order_id', 'product_id', 'category_clean', 'customer_city', 'customer_state'
+)
+
+# Narrow numeric dtypes for the columns every reduction reads; the bincount
+# based revenue reductions still accumulate in float64
+NARROW_DTYPES = {
+    'price': np.float32,
+    'order_year': np.int16,
+    'order_month': np.int8,
+    'review_score': np.float32,
+}
+
+# Columns read by the delivered-order metrics; the shared subset carries only these
+METRIC_COLUMNS = (
+    'order_id', 'product_id', 'price', 'order_year', 'order_month',
+    'category_clean', 'customer_state', 'customer_city', 'delivery_days', 'review_score'
+)
+
+
+def _nunique(values: pd.Series) -> int:
+    """
+    Count distinct non-null values, using category codes when available.
+    
+    Args:
+        values (pd.Series): Values to count
+        
+    Returns:
+        int: Number of distinct non-null values
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+        return int(np.count_nonzero(counts))
+    return values.nunique()
+
+
+def _group_sum_count(codes: np.ndarray, values: np.ndarray,
+                     ngroups: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sum, count and average values per integer group code.
+    
+    Args:
+        codes (np.ndarray): Non-negative group code of each value
+        values (np.ndarray): Values to aggregate
+        ngroups (int): Number of possible groups
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Sum, count and mean per group;
+            the mean is 0 for empty groups
+    """
+    # bincount returns integers for empty input even when weighted
+    sums = np.bincount(codes, weights=values, minlength=ngroups).astype(np.float64, copy=False)
+    counts = np.bincount(codes, minlength=ngroups)
+    means = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+    return sums, counts, means
+
+
+def _group_codes(keys: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Integer group codes and their labels for a key column.
+    
+    Categorical keys reuse their existing codes; other dtypes are factorized
+    in a single hashed pass. Missing keys get the code -1.
+    
+    Args:
+        keys (pd.Series): Group keys
+        
+    Returns:
+        Tuple[np.ndarray, pd.Index]: Code of each key and the label of each code
+    """
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        return keys.cat.codes.to_numpy(), keys.cat.categories
+    codes, uniques = pd.factorize(keys, sort=False)
+    return codes, pd.Index(uniques)
+
+
+def _group_agg(keys: pd.Series, values: pd.Series) -> pd.DataFrame:
+    """
+    Equivalent of ``values.groupby(keys, observed=True).agg(['sum', 'count', 'mean'])``
+    computed with bincounts over integer group codes.
+    
+    Args:
+        keys (pd.Series): Group keys
+        values (pd.Series): Values to aggregate
+        
+    Returns:
+        pd.DataFrame: 'sum', 'count' and 'mean' per observed key
+    """
+    codes, labels = _group_codes(keys)
+    valid = codes >= 0
+    sums, counts, means = _group_sum_count(
+        codes[valid], values.to_numpy(np.float64)[valid], len(labels)
+    )
+    observed = counts > 0
+    return pd.DataFrame(
+        {'sum': sums[observed], 'count': counts[observed], 'mean': means[observed]},
+        index=pd.Index(labels[observed], name=keys.name)
+    )
+
+
+def _top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k largest values, largest first, without a full sort.
+    
+    Ties are broken by position, matching a stable descending sort.
+    
+    Args:
+        values (np.ndarray): Values to rank
+        k (int): Number of positions to return
+        
+    Returns:
+        np.ndarray: Up to k positions into ``values`` in descending value order
+    """
+    if values.size > k > 0:
+        # Everything above the k-th largest value, then the earliest ties
+        kth_value = np.partition(values, -k)[-k]
+        above = np.flatnonzero(values > kth_value)
+        ties = np.flatnonzero(values == kth_value)[:k - above.size]
+        candidates = np.sort(np.concatenate((above, ties)))
+    else:
+        candidates = np.arange(min(values.size, max(k, 0)))
+    return candidates[np.argsort(-values[candidates], kind='stable')]
+
+
+def _order_reduce(order_ids: pd.Series, prices: pd.Series) -> Tuple[float, int, float]:
+    """
+    Reduce item prices to order-level revenue totals in one linear pass.
+    
+    Order IDs are reduced with ``np.bincount`` over their group codes.
+    
+    Args:
+        order_ids (pd.Series): Order ID of each item
+        prices (pd.Series): Price of each item
+        
+    Returns:
+        Tuple[float, int, float]: Total revenue, order count and average order value
+    """
+    codes, labels = _group_codes(order_ids)
+    valid = codes >= 0
+    sums, counts, _ = _group_sum_count(
+        codes[valid], prices.to_numpy(np.float64)[valid], len(labels)
+    )
+    order_sums = sums[counts > 0]
+    
+    total_revenue = order_sums.sum()
+    total_orders = order_sums.size
+    average_order_value = total_revenue / total_orders if total_orders > 0 else np.nan
+    return total_revenue, total_orders, average_order_value
+
+
+def _safe_pct(cur, prev):
+    """
+    Percentage change from ``prev`` to ``cur``, or 0 where ``prev`` is not positive.
+    
+    Args:
+        cur: Current value(s), scalar or array-like
+        prev: Previous value(s), scalar or array-like
+        
+    Returns:
+        float or np.ndarray: Percentage change, a float for scalar inputs
+    """
+    prev = np.asarray(prev, dtype=np.float64)
+    cur = np.asarray(cur, dtype=np.float64)
+    positive = prev > 0
+    pct = np.where(positive, (cur - prev) * (100.0 / np.where(positive, prev, 1.0)), 0.0)
+    return float(pct) if pct.ndim == 0 else pct
+
+
+def _delivery_buckets(delivery_days: np.ndarray) -> pd.Categorical:
+    """
+    Assign delivery times to buckets with a single binary search pass.
+    
+    Equivalent to ``pd.cut`` with right-closed bins and ``include_lowest=True``;
+    negative delivery times fall outside every bucket.
+    
+    Args:
+        delivery_days (np.ndarray): Non-null delivery times in days
+        
+    Returns:
+        pd.Categorical: Ordered delivery bucket for each value
+    """
+    codes = np.searchsorted(DELIVERY_BUCKET_EDGES, delivery_days, side='left').astype(np.int8)
+    codes[delivery_days < 0] = -1
+    return pd.Categorical.from_codes(codes, categories=DELIVERY_BUCKET_LABELS, ordered=True)
 
 
 class BusinessMetricsCalculator:
@@ -17,6 +210,11 @@ class BusinessMetricsCalculator:
     
     This class provides methods to compute revenue metrics, customer analytics,
     product performance, geographic analysis, and operational metrics.
+    
+    Each metric family is computed once per instance. The ``calculate_*``
+    methods return a new dict on every call, but the DataFrames and Series in
+    it are shared with the cache and should be treated as read-only; copy
+    them before modifying.
     """
     
     def __init__(self, data: pd.DataFrame):
@@ -26,162 +224,290 @@ class BusinessMetricsCalculator:
         Args:
             data (pd.DataFrame): Master dataset containing all joined information
         """
+        # Encode string keys as categoricals and narrow numeric columns, on a
+        # shallow copy so the caller's frame is left untouched
+        conversions = {
+            col: 'category' for col in CATEGORICAL_COLUMNS
+            if col in data.columns and not isinstance(data[col].dtype, pd.CategoricalDtype)
+        }
+        for col, dtype in NARROW_DTYPES.items():
+            if col not in data.columns or data[col].dtype == dtype:
+                continue
+            # Integer dtypes cannot hold NaN; leave columns with gaps as they are
+            if np.issubdtype(dtype, np.integer) and data[col].isna().any():
+                continue
+            conversions[col] = dtype
+        
+        if conversions:
+            data = data.copy(deep=False)
+            for col, dtype in conversions.items():
+                data[col] = data[col].astype(dtype)
+        
         self.data = data
-        self.delivered_orders = data[data['order_status'] == 'delivered'].copy()
+        
+        # Positional row indices per order status, built in a single pass
+        self._status_idx = data.groupby('order_status', sort=False, observed=True).indices
+        
+        # Filter once and project to the metric columns; every metric reads this
+        metric_columns = [col for col in METRIC_COLUMNS if col in data.columns]
+        self._delivered = data.iloc[
+            self._status_idx_for('delivered'), data.columns.get_indexer(metric_columns)
+        ]
     
-    def calculate_revenue_metrics(self, 
-                                comparison_period: Optional[pd.DataFrame] = None) -> Dict:
+    @cached_property
+    def delivered_orders(self) -> pd.DataFrame:
         """
-        Calculate comprehensive revenue metrics.
+        Delivered orders with every column of the loaded data.
+        
+        Built on first access only; the metric methods read a subset
+        projected to the columns they use.
+        
+        Returns:
+            pd.DataFrame: Rows of ``self.data`` with status 'delivered'
+        """
+        return self.data.iloc[self._status_idx_for('delivered')]
+    
+    def _status_idx_for(self, status: str) -> np.ndarray:
+        """
+        Get the positional row indices for an order status.
         
         Args:
-            comparison_period (pd.DataFrame, optional): Data for comparison period
+            status (str): Order status value
             
         Returns:
-            Dict: Revenue metrics including totals, growth, and trends
+            np.ndarray: Row positions in ``self.data`` with that status
+        """
+        return self._status_idx.get(status, np.empty(0, dtype=np.int64))
+    
+    def _revenue_scalars(self) -> Tuple[float, int, float]:
+        """
+        Calculate only the headline revenue totals, skipping the monthly trend.
+        
+        Returns:
+            Tuple[float, int, float]: Total revenue, order count and average order value
         """
-        current_data = self.delivered_orders
+        return _order_reduce(self._delivered['order_id'], self._delivered['price'])
+    
+    @cached_property
+    def revenue_metrics(self) -> Dict:
+        """
+        Revenue metrics for the loaded data, computed once per instance.
+        
+        Returns:
+            Dict: Revenue totals and monthly trend without growth figures
+        """
+        current_data = self._delivered
+        
+        # Single pass over order_id/price; all scalar totals derive from it
+        total_revenue, total_orders, average_order_value = self._revenue_scalars()
+        total_items_sold = len(current_data)
         
         metrics = {
-            'total_revenue': current_data['price'].sum(),
-            'total_orders': current_data['order_id'].nunique(),
-            'total_items_sold': len(current_data),
-            'average_order_value': current_data.groupby('order_id')['price'].sum().mean(),
-            'average_item_price': current_data['price'].mean(),
+            'total_revenue': total_revenue,
+            'total_orders': total_orders,
+            'total_items_sold': total_items_sold,
+            'average_order_value': average_order_value,
+            'average_item_price': (
+                total_revenue / total_items_sold if total_items_sold > 0 else np.nan
+            ),
         }
         
-        # Monthly revenue trend
+        # Monthly revenue trend, accumulated in float64 like the other totals
         monthly_revenue = (
-            current_data.groupby(['order_year', 'order_month'])['price']
+            current_data['price'].astype(np.float64)
+            .groupby(
+                [current_data['order_year'], current_data['order_month']],
+                sort=True, observed=True
+            )
             .sum()
             .reset_index()
         )
-        monthly_revenue['year_month'] = (
-            monthly_revenue['order_year'].astype(str) + '-' + 
-            monthly_revenue['order_month'].astype(str).str.zfill(2)
-        )
+        monthly_revenue['year_month'] = pd.PeriodIndex.from_fields(
+            year=monthly_revenue['order_year'],
+            month=monthly_revenue['order_month'],
+            freq='M'
+        ).strftime('%Y-%m')
         metrics['monthly_revenue_trend'] = monthly_revenue
         
+        return metrics
+    
+    def _growth_vs(self, prev: Dict) -> Dict:
+        """
+        Calculate growth of the cached revenue metrics against a previous period.
+        
+        Args:
+            prev (Dict): Previous period 'total_revenue', 'total_orders'
+                and 'average_order_value'
+            
+        Returns:
+            Dict: Revenue, order and AOV growth percentages
+        """
+        current = self.revenue_metrics
+        
+        return {
+            'revenue_growth': _safe_pct(current['total_revenue'], prev['total_revenue']),
+            'order_growth': _safe_pct(current['total_orders'], prev['total_orders']),
+            'aov_growth': _safe_pct(current['average_order_value'], prev['average_order_value']),
+        }
+    
+    def calculate_revenue_metrics(self, 
+                                comparison_period: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        Calculate comprehensive revenue metrics.
+        
+        Args:
+            comparison_period (pd.DataFrame, optional): Data for comparison period
+            
+        Returns:
+            Dict: Revenue metrics including totals, growth, and trends
+        """
+        # Copy so growth keys never leak into the cached base metrics
+        metrics = dict(self.revenue_metrics)
+        
         # Calculate growth metrics if comparison period provided
         if comparison_period is not None:
             comparison_delivered = comparison_period[
                 comparison_period['order_status'] == 'delivered'
             ]
             
-            prev_revenue = comparison_delivered['price'].sum()
-            prev_orders = comparison_delivered['order_id'].nunique()
-            prev_aov = comparison_delivered.groupby('order_id')['price'].sum().mean()
-            
-            metrics['revenue_growth'] = (
-                (metrics['total_revenue'] - prev_revenue) / prev_revenue * 100
-                if prev_revenue > 0 else 0
-            )
-            metrics['order_growth'] = (
-                (metrics['total_orders'] - prev_orders) / prev_orders * 100
-                if prev_orders > 0 else 0
-            )
-            metrics['aov_growth'] = (
-                (metrics['average_order_value'] - prev_aov) / prev_aov * 100
-                if prev_aov > 0 else 0
+            prev_revenue, prev_orders, prev_aov = _order_reduce(
+                comparison_delivered['order_id'], comparison_delivered['price']
             )
+            
+            metrics.update(self._growth_vs({
+                'total_revenue': prev_revenue,
+                'total_orders': prev_orders,
+                'average_order_value': prev_aov,
+            }))
         
         return metrics
     
-    def calculate_product_metrics(self) -> Dict:
+    @cached_property
+    def product_metrics(self) -> Dict:
         """
         Calculate product-related business metrics.
         
         Returns:
             Dict: Product performance metrics
         """
-        current_data = self.delivered_orders
+        current_data = self._delivered
         
         # Revenue by category
         category_revenue = (
-            current_data.groupby('category_clean')['price']
-            .agg(['sum', 'count', 'mean'])
-            .round(2)
+            _group_agg(current_data['category_clean'], current_data['price'])
             .sort_values('sum', ascending=False)
         )
         category_revenue.columns = ['total_revenue', 'items_sold', 'avg_price']
         
         # Top products by revenue
         product_revenue = (
-            current_data.groupby('product_id')['price']
-            .agg(['sum', 'count'])
+            _group_agg(current_data['product_id'], current_data['price'])[['sum', 'count']]
             .sort_values('sum', ascending=False)
             .head(20)
         )
         product_revenue.columns = ['total_revenue', 'items_sold']
         
         # Category performance metrics
-        category_metrics = category_revenue.copy()
-        category_metrics['revenue_share'] = (
-            category_metrics['total_revenue'] / 
-            category_metrics['total_revenue'].sum() * 100
-        ).round(2)
+        category_totals = category_revenue['total_revenue'].to_numpy()
+        category_metrics = category_revenue.assign(
+            revenue_share=category_totals / category_totals.sum() * 100
+        )
         
         return {
             'category_revenue': category_revenue,
             'category_metrics': category_metrics,
             'top_products': product_revenue,
-            'total_categories': current_data['category_clean'].nunique(),
-            'total_products': current_data['product_id'].nunique()
+            'total_categories': _nunique(current_data['category_clean']),
+            'total_products': _nunique(current_data['product_id'])
         }
     
-    def calculate_geographic_metrics(self) -> Dict:
+    def calculate_product_metrics(self) -> Dict:
+        """
+        Calculate product-related business metrics.
+        
+        Returns:
+            Dict: Product performance metrics
+        """
+        return dict(self.product_metrics)
+    
+    @cached_property
+    def geographic_metrics(self) -> Dict:
         """
         Calculate geographic distribution metrics.
         
         Returns:
             Dict: Geographic performance metrics
         """
-        current_data = self.delivered_orders
+        current_data = self._delivered
         
         # Revenue by state
         state_revenue = (
-            current_data.groupby('customer_state')['price']
-            .agg(['sum', 'count', 'mean'])
-            .round(2)
+            _group_agg(current_data['customer_state'], current_data['price'])
             .sort_values('sum', ascending=False)
         )
         state_revenue.columns = ['total_revenue', 'orders', 'avg_order_value']
         
-        # Revenue by city (top 20)
-        city_revenue = (
-            current_data.groupby(['customer_state', 'customer_city'])['price']
-            .sum()
-            .sort_values(ascending=False)
-            .head(20)
-            .reset_index()
+        # Revenue by city (top 20): sum over a fused state/city code, then a
+        # top-k selection instead of sorting every pair
+        states = current_data['customer_state']
+        cities = current_data['customer_city']
+        state_codes = states.cat.codes.to_numpy().astype(np.int64)
+        city_codes = cities.cat.codes.to_numpy().astype(np.int64)
+        n_cities = len(cities.cat.categories)
+        valid = (state_codes >= 0) & (city_codes >= 0)
+        
+        pair_sums, pair_counts, _ = _group_sum_count(
+            state_codes[valid] * n_cities + city_codes[valid],
+            current_data['price'].to_numpy(np.float64)[valid],
+            len(states.cat.categories) * n_cities
         )
+        observed_pairs = np.flatnonzero(pair_counts)
+        top_pairs = observed_pairs[_top_k(pair_sums[observed_pairs], 20)]
+        
+        city_revenue = pd.DataFrame({
+            'customer_state': states.cat.categories[top_pairs // max(n_cities, 1)],
+            'customer_city': cities.cat.categories[top_pairs % max(n_cities, 1)],
+            'price': pair_sums[top_pairs]
+        })
         
         # Geographic distribution metrics
-        state_metrics = state_revenue.copy()
-        state_metrics['revenue_share'] = (
-            state_metrics['total_revenue'] / 
-            state_metrics['total_revenue'].sum() * 100
-        ).round(2)
+        state_totals = state_revenue['total_revenue'].to_numpy()
+        state_metrics = state_revenue.assign(
+            revenue_share=state_totals / state_totals.sum() * 100
+        )
         
         return {
             'state_revenue': state_revenue,
             'state_metrics': state_metrics,
             'top_cities': city_revenue,
-            'total_states': current_data['customer_state'].nunique(),
-            'total_cities': current_data['customer_city'].nunique()
+            'total_states': _nunique(current_data['customer_state']),
+            'total_cities': _nunique(current_data['customer_city'])
         }
     
-    def calculate_customer_experience_metrics(self) -> Dict:
+    def calculate_geographic_metrics(self) -> Dict:
+        """
+        Calculate geographic distribution metrics.
+        
+        Returns:
+            Dict: Geographic performance metrics
+        """
+        return dict(self.geographic_metrics)
+    
+    @cached_property
+    def cx_metrics(self) -> Dict:
         """
         Calculate customer experience and satisfaction metrics.
         
         Returns:
             Dict: Customer experience metrics
         """
-        current_data = self.delivered_orders
+        current_data = self._delivered
         
         # Delivery performance
-        delivery_data = current_data.dropna(subset=['delivery_days'])
+        # Only the two columns used below, rather than the full delivered frame
+        delivery_data = current_data.loc[
+            current_data['delivery_days'].notna(), ['delivery_days', 'review_score']
+        ]
         
         delivery_metrics = {
             'avg_delivery_days': delivery_data['delivery_days'].mean(),
@@ -190,50 +516,56 @@ class BusinessMetricsCalculator:
             'on_time_delivery_rate': None  # Would need estimated vs actual comparison
         }
         
-        # Create delivery time buckets
-        delivery_data_copy = delivery_data.copy()
-        delivery_data_copy['delivery_bucket'] = pd.cut(
-            delivery_data_copy['delivery_days'],
-            bins=[0, 3, 7, 14, 30, float('inf')],
-            labels=['1-3 days', '4-7 days', '8-14 days', '15-30 days', '30+ days'],
-            include_lowest=True
-        )
-        
+        # Create delivery time buckets once; reused for satisfaction below
+        delivery_buckets = _delivery_buckets(delivery_data['delivery_days'].to_numpy(np.float64))
         delivery_distribution = (
-            delivery_data_copy['delivery_bucket']
+            pd.Series(delivery_buckets, name='delivery_bucket')
             .value_counts()
             .sort_index()
         )
         
         # Review metrics
-        review_data = current_data.dropna(subset=['review_score'])
+        review_scores = current_data['review_score'].dropna()
+        
+        # Scores are small integers, so a bincount is already in score order;
+        # the index keeps the float scores that value_counts would report
+        score_counts = np.bincount(review_scores.to_numpy(np.int64))
+        observed_scores = np.flatnonzero(score_counts)
+        review_distribution = pd.Series(
+            score_counts[observed_scores],
+            index=pd.Index(observed_scores.astype(np.float64), name='review_score'),
+            name='count'
+        )
         
         review_metrics = {
-            'avg_review_score': review_data['review_score'].mean(),
-            'review_distribution': review_data['review_score'].value_counts().sort_index(),
-            'total_reviews': len(review_data),
-            'review_rate': len(review_data) / len(current_data) * 100
+            'avg_review_score': review_scores.mean(),
+            'review_distribution': review_distribution,
+            'total_reviews': len(review_scores),
+            'review_rate': len(review_scores) / len(current_data) * 100
         }
         
         # Satisfaction by delivery time
-        if not review_data.empty and not delivery_data.empty:
-            satisfaction_by_delivery = (
-                current_data.dropna(subset=['review_score', 'delivery_days'])
-                .copy()
-            )
-            satisfaction_by_delivery['delivery_bucket'] = pd.cut(
-                satisfaction_by_delivery['delivery_days'],
-                bins=[0, 3, 7, 14, 30, float('inf')],
-                labels=['1-3 days', '4-7 days', '8-14 days', '15-30 days', '30+ days'],
-                include_lowest=True
+        if not review_scores.empty and not delivery_data.empty:
+            # Mean score per bucket from bincounts over the bucket codes,
+            # skipping unreviewed orders and out-of-range delivery times
+            scores = delivery_data['review_score'].to_numpy(np.float64)
+            valid = ~np.isnan(scores) & (delivery_buckets.codes >= 0)
+            _, counts, means = _group_sum_count(
+                delivery_buckets.codes[valid].astype(np.intp), scores[valid],
+                len(DELIVERY_BUCKET_LABELS)
             )
             
-            satisfaction_metrics = (
-                satisfaction_by_delivery.groupby('delivery_bucket')['review_score']
-                .agg(['mean', 'count'])
-                .round(2)
+            # Every bucket is reported; empty ones have no average score
+            satisfaction_metrics = pd.DataFrame(
+                {
+                    'avg_review_score': np.where(counts > 0, means, np.nan),
+                    'review_count': counts
+                },
+                index=pd.CategoricalIndex(
+                    DELIVERY_BUCKET_LABELS, categories=DELIVERY_BUCKET_LABELS,
+                    ordered=True, name='delivery_bucket'
+                )
             )
-            satisfaction_metrics.columns = ['avg_review_score', 'review_count']
         else:
             satisfaction_metrics = pd.DataFrame()
         
@@ -244,30 +576,46 @@ class BusinessMetricsCalculator:
             'satisfaction_by_delivery': satisfaction_metrics
         }
     
-    def calculate_operational_metrics(self) -> Dict:
+    def calculate_customer_experience_metrics(self) -> Dict:
+        """
+        Calculate customer experience and satisfaction metrics.
+        
+        Returns:
+            Dict: Customer experience metrics
+        """
+        return dict(self.cx_metrics)
+    
+    @cached_property
+    def operational_metrics(self) -> Dict:
         """
         Calculate operational performance metrics.
         
         Returns:
             Dict: Operational metrics
         """
-        all_orders = self.data
-        delivered_orders = self.delivered_orders
+        # Every count comes from the status index built in __init__
+        total_orders = len(self.data)
+        delivered_count = len(self._status_idx_for('delivered'))
+        canceled_count = len(self._status_idx_for('canceled'))
+        returned_count = len(self._status_idx_for('returned'))
         
         # Order status distribution
-        status_distribution = all_orders['order_status'].value_counts()
-        status_percentages = (status_distribution / len(all_orders) * 100).round(2)
+        status_distribution = pd.Series(
+            {status: len(idx) for status, idx in self._status_idx.items()},
+            dtype=np.int64,
+            name='count'
+        ).sort_values(ascending=False)
+        status_distribution.index.name = 'order_status'
+        status_percentages = (status_distribution * (100.0 / total_orders)).round(2)
         
         # Fulfillment metrics
-        fulfillment_rate = len(delivered_orders) / len(all_orders) * 100
+        fulfillment_rate = delivered_count / total_orders * 100
         
         # Cancellation analysis
-        canceled_orders = all_orders[all_orders['order_status'] == 'canceled']
-        cancellation_rate = len(canceled_orders) / len(all_orders) * 100
+        cancellation_rate = canceled_count / total_orders * 100
         
         # Return analysis
-        returned_orders = all_orders[all_orders['order_status'] == 'returned']
-        return_rate = len(returned_orders) / len(delivered_orders) * 100 if len(delivered_orders) > 0 else 0
+        return_rate = returned_count / delivered_count * 100 if delivered_count > 0 else 0
         
         return {
             'order_status_distribution': status_distribution,
@@ -275,10 +623,19 @@ class BusinessMetricsCalculator:
             'fulfillment_rate': fulfillment_rate,
             'cancellation_rate': cancellation_rate,
             'return_rate': return_rate,
-            'total_orders': len(all_orders),
-            'delivered_orders': len(delivered_orders)
+            'total_orders': total_orders,
+            'delivered_orders': delivered_count
         }
     
+    def calculate_operational_metrics(self) -> Dict:
+        """
+        Calculate operational performance metrics.
+        
+        Returns:
+            Dict: Operational metrics
+        """
+        return dict(self.operational_metrics)
+    
     def generate_executive_summary(self, 
                                  comparison_period: Optional[pd.DataFrame] = None) -> Dict:
         """
@@ -291,10 +648,10 @@ class BusinessMetricsCalculator:
             Dict: Executive summary metrics
         """
         revenue_metrics = self.calculate_revenue_metrics(comparison_period)
-        product_metrics = self.calculate_product_metrics()
-        geographic_metrics = self.calculate_geographic_metrics()
-        cx_metrics = self.calculate_customer_experience_metrics()
-        operational_metrics = self.calculate_operational_metrics()
+        product_metrics = self.product_metrics
+        geographic_metrics = self.geographic_metrics
+        cx_metrics = self.cx_metrics
+        operational_metrics = self.operational_metrics
         
         # Key insights
         top_category = product_metrics['category_metrics'].index[0]
@@ -348,28 +705,17 @@ def calculate_period_comparison(current_data: pd.DataFrame,
     current_calc = BusinessMetricsCalculator(current_data)
     previous_calc = BusinessMetricsCalculator(previous_data)
     
-    current_metrics = current_calc.calculate_revenue_metrics()
-    previous_metrics = previous_calc.calculate_revenue_metrics()
+    # Only the headline totals are compared, so skip the monthly trend reduction
+    current_revenue, current_orders, current_aov = current_calc._revenue_scalars()
+    prev_revenue, prev_orders, prev_aov = previous_calc._revenue_scalars()
     
     comparison = {
-        'revenue_change': current_metrics['total_revenue'] - previous_metrics['total_revenue'],
-        'revenue_growth_pct': (
-            (current_metrics['total_revenue'] - previous_metrics['total_revenue']) / 
-            previous_metrics['total_revenue'] * 100
-            if previous_metrics['total_revenue'] > 0 else 0
-        ),
-        'order_change': current_metrics['total_orders'] - previous_metrics['total_orders'],
-        'order_growth_pct': (
-            (current_metrics['total_orders'] - previous_metrics['total_orders']) / 
-            previous_metrics['total_orders'] * 100
-            if previous_metrics['total_orders'] > 0 else 0
-        ),
-        'aov_change': current_metrics['average_order_value'] - previous_metrics['average_order_value'],
-        'aov_growth_pct': (
-            (current_metrics['average_order_value'] - previous_metrics['average_order_value']) / 
-            previous_metrics['average_order_value'] * 100
-            if previous_metrics['average_order_value'] > 0 else 0
-        )
+        'revenue_change': current_revenue - prev_revenue,
+        'revenue_growth_pct': _safe_pct(current_revenue, prev_revenue),
+        'order_change': current_orders - prev_orders,
+        'order_growth_pct': _safe_pct(current_orders, prev_orders),
+        'aov_change': current_aov - prev_aov,
+        'aov_growth_pct': _safe_pct(current_aov, prev_aov)
     }
     
     return comparison
\ No newline at end of file
@@ -5,6 +5,7 @@ A professional Streamlit dashboard for comprehensive e-commerce business analysi
 with interactive visualizations and configurable date range filtering.
 """
 
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -16,8 +17,8 @@ import warnings
 warnings.filterwarnings('ignore')
 
 # Import custom modules
-from data_loader import EcommerceDataLoader, load_and_prepare_data
-from business_metrics import BusinessMetricsCalculator, calculate_period_comparison
+from data_loader import EcommerceDataLoader, load_and_prepare_data, FILE_MAPPING
+from business_metrics import BusinessMetricsCalculator, calculate_period_comparison, _order_reduce
 
 # Page configuration
 st.set_page_config(
@@ -68,36 +69,139 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+# Directory holding the source CSV files
+DATA_PATH = 'ecommerce_data/'
+
+def _data_files_mtime(data_path):
+    """Modification times of the source files, used to key the master dataset caches."""
+    return tuple(
+        os.path.getmtime(os.path.join(data_path, FILE_MAPPING[name]))
+        for name in sorted(FILE_MAPPING)
+    )
+
+@st.cache_data(persist="disk", show_spinner="Loading master dataset…")
+def _build_master_df(data_path, files_mtime):
+    """Load, clean and join the full dataset, persisted to disk across restarts."""
+    loader = EcommerceDataLoader(data_path)
+    loader.load_raw_data()
+    loader.clean_and_transform_data()
+    
+    return loader.create_master_dataset()
+
+@st.cache_resource
+def _get_master_df(data_path, files_mtime):
+    """Share one in-memory master dataset per process, sorted by purchase time."""
+    return _build_master_df(data_path, files_mtime)
+
 def load_dashboard_data(start_date, end_date):
-    """Load and cache data for the dashboard."""
+    """Slice the cached master dataset into the selected and previous periods."""
     try:
-        # Load data
-        loader = EcommerceDataLoader('ecommerce_data/')
-        loader.load_raw_data()
-        loader.clean_and_transform_data()
-        master_df = loader.create_master_dataset()
+        master_df = _get_master_df(DATA_PATH, _data_files_mtime(DATA_PATH))
+        timestamps = master_df['order_purchase_timestamp']
         
-        # Filter by date range
-        filtered_df = master_df[
-            (master_df['order_purchase_timestamp'] >= pd.to_datetime(start_date)) &
-            (master_df['order_purchase_timestamp'] <= pd.to_datetime(end_date))
-        ]
+        start = pd.to_datetime(start_date)
+        end = pd.to_datetime(end_date)
         
         # Calculate previous period for comparison
-        date_diff = pd.to_datetime(end_date) - pd.to_datetime(start_date)
-        prev_start = pd.to_datetime(start_date) - date_diff
-        prev_end = pd.to_datetime(start_date)
+        date_diff = end - start
+        prev_start = start - date_diff
+        
+        # The master dataset is sorted by purchase time, so each period is a
+        # contiguous row range found by binary search
+        lo = timestamps.searchsorted(start, side='left')
+        hi = timestamps.searchsorted(end, side='right')
+        prev_lo = timestamps.searchsorted(prev_start, side='left')
         
-        prev_df = master_df[
-            (master_df['order_purchase_timestamp'] >= prev_start) &
-            (master_df['order_purchase_timestamp'] < prev_end)
-        ]
+        filtered_df = master_df.iloc[lo:hi]
+        prev_df = master_df.iloc[prev_lo:lo]
         
-        return filtered_df, prev_df, loader
+        return filtered_df, prev_df
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
-        return None, None, None
+        return None, None
+
+def _hash_master_slice(df):
+    """Identify a row range of the cached master dataset without hashing its contents."""
+    rows = (len(df), df.index[0], df.index[-1]) if len(df) else (0,)
+    return (_data_files_mtime(DATA_PATH),) + rows
+
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_master_slice})
+def _quick_totals(df):
+    """Headline revenue totals for a period, as used by the KPI trend indicators."""
+    delivered = df.loc[df['order_status'] == 'delivered', ['order_id', 'price']]
+    total_revenue, total_orders, average_order_value = _order_reduce(
+        delivered['order_id'], delivered['price']
+    )
+    return {
+        'total_revenue': total_revenue,
+        'total_orders': total_orders,
+        'average_order_value': average_order_value
+    }
+
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_master_slice})
+def _period_metrics(df):
+    """Revenue, product, geographic and customer experience metrics for a period."""
+    calculator = BusinessMetricsCalculator(df)
+    return (
+        calculator.calculate_revenue_metrics(),
+        calculator.calculate_product_metrics(),
+        calculator.calculate_geographic_metrics(),
+        calculator.calculate_customer_experience_metrics()
+    )
+
+# Trend chart period frequencies
+TREND_FREQUENCIES = ('W', 'M', 'Q')
+
+def _revenue_bins(master_df):
+    """Running delivered revenue and period boundaries over a time-sorted master dataset."""
+    # cumulative[i] is the delivered revenue in master rows [0, i)
+    delivered = (master_df['order_status'] == 'delivered').to_numpy()
+    revenue = np.where(delivered, master_df['price'].to_numpy(np.float64), 0.0)
+    cumulative = np.concatenate(([0.0], np.cumsum(revenue)))
+    
+    # Rows are sorted by purchase time, so each period is a contiguous run
+    # of rows; keep the first row of every run and its period label
+    timestamps = master_df['order_purchase_timestamp']
+    boundaries = {}
+    for freq in TREND_FREQUENCIES:
+        periods = pd.PeriodIndex(timestamps, freq=freq)
+        ordinals = periods.asi8
+        starts = np.flatnonzero(np.r_[True, ordinals[1:] != ordinals[:-1]])
+        boundaries[freq] = (starts, periods[starts])
+    
+    return cumulative, boundaries
+
+def _bin_revenue(bins, df, freq):
+    """Delivered-order revenue per period for a row slice, read off precomputed bins."""
+    # The bins are indexed by master row position, so only contiguous
+    # iloc slices of the master dataset (which keep its RangeIndex) qualify
+    if not isinstance(df.index, pd.RangeIndex) or df.index.step != 1 or df.empty:
+        raise ValueError("Expected a non-empty contiguous row slice of the master dataset")
+    
+    cumulative, boundaries = bins
+    starts, periods = boundaries[freq]
+    
+    # The row range is [lo, hi); the first and last periods may be partial
+    lo, hi = df.index.start, df.index.stop
+    first = starts.searchsorted(lo, side='right') - 1
+    last = starts.searchsorted(hi, side='left')
+    edges = np.r_[lo, starts[first + 1:last], hi]
+    
+    grouped = pd.DataFrame({
+        'order_purchase_timestamp': periods[first:last],
+        'price': np.diff(cumulative[edges])
+    })
+    return grouped[grouped['price'] > 0].reset_index(drop=True)
+
+@st.cache_resource
+def _get_revenue_bins(data_path, files_mtime):
+    """Revenue bins over the full master dataset, built once per data version."""
+    return _revenue_bins(_get_master_df(data_path, files_mtime))
+
+def _period_revenue(df, freq):
+    """Delivered-order revenue per period for a row slice of the master dataset."""
+    bins = _get_revenue_bins(DATA_PATH, _data_files_mtime(DATA_PATH))
+    return _bin_revenue(bins, df, freq)
 
 def format_currency(value):
     """Format currency values for display."""
@@ -108,6 +212,18 @@ def format_currency(value):
     else:
         return f"${value:.0f}"
 
+def format_currency_vec(values):
+    """Format an array of currency values for display, matching format_currency."""
+    values = np.asarray(values, dtype=np.float64)
+    millions = values >= 1_000_000
+    thousands = ~millions & (values >= 1_000)
+    
+    scaled = np.where(millions, values / 1_000_000, np.where(thousands, values / 1_000, values))
+    digits = np.where(millions, np.char.mod('%.1f', scaled), np.char.mod('%.0f', scaled))
+    suffixes = np.where(millions, 'M', np.where(thousands, 'K', ''))
+    
+    return np.char.add(np.char.add('$', digits), suffixes)
+
 def format_number(value):
     """Format numbers for display."""
     if value >= 1_000_000:
@@ -212,9 +328,10 @@ def create_revenue_trend_chart(current_data, prev_data):
         return fig
     
     # Determine aggregation level based on date range
-    current_delivered = current_data[current_data['order_status'] == 'delivered']
-    date_range = (current_delivered['order_purchase_timestamp'].max() - 
-                 current_delivered['order_purchase_timestamp'].min()).days
+    delivered_timestamps = current_data.loc[
+        current_data['order_status'] == 'delivered', 'order_purchase_timestamp'
+    ]
+    date_range = (delivered_timestamps.max() - delivered_timestamps.min()).days
     
     if date_range <= 90:  # 3 months or less - use weekly
         freq = 'W'
@@ -227,14 +344,8 @@ def create_revenue_trend_chart(current_data, prev_data):
         title_suffix = "(Quarterly)"
     
     # Prepare current period data
-    if not current_delivered.empty:
-        current_grouped = (
-            current_delivered
-            .groupby(current_delivered['order_purchase_timestamp'].dt.to_period(freq))['price']
-            .sum()
-            .reset_index()
-        )
-        current_grouped = current_grouped[current_grouped['price'] > 0]
+    if not delivered_timestamps.empty:
+        current_grouped = _period_revenue(current_data, freq)
         
         if not current_grouped.empty:
             # Create normalized x-axis (period number)
@@ -254,31 +365,23 @@ def create_revenue_trend_chart(current_data, prev_data):
     
     # Prepare previous period data
     if not prev_data.empty:
-        prev_delivered = prev_data[prev_data['order_status'] == 'delivered']
-        if not prev_delivered.empty:
-            prev_grouped = (
-                prev_delivered
-                .groupby(prev_delivered['order_purchase_timestamp'].dt.to_period(freq))['price']
-                .sum()
-                .reset_index()
-            )
-            prev_grouped = prev_grouped[prev_grouped['price'] > 0]
+        prev_grouped = _period_revenue(prev_data, freq)
+        
+        if not prev_grouped.empty:
+            # Create normalized x-axis (period number)
+            prev_grouped['period_num'] = range(1, len(prev_grouped) + 1)
+            prev_grouped['period_label'] = prev_grouped['order_purchase_timestamp'].astype(str)
             
-            if not prev_grouped.empty:
-                # Create normalized x-axis (period number)
-                prev_grouped['period_num'] = range(1, len(prev_grouped) + 1)
-                prev_grouped['period_label'] = prev_grouped['order_purchase_timestamp'].astype(str)
-                
-                fig.add_trace(go.Scatter(
-                    x=prev_grouped['period_num'],
-                    y=prev_grouped['price'],
-                    mode='lines+markers',
-                    name='Previous Period',
-                    line=dict(color='#A23B72', width=2, dash='dash'),
-                    marker=dict(size=6),
-                    customdata=prev_grouped['period_label'],
-                    hovertemplate='<b>%{customdata}</b><br>Revenue: $%{y:,.0f}<extra></extra>'
-                ))
+            fig.add_trace(go.Scatter(
+                x=prev_grouped['period_num'],
+                y=prev_grouped['price'],
+                mode='lines+markers',
+                name='Previous Period',
+                line=dict(color='#A23B72', width=2, dash='dash'),
+                marker=dict(size=6),
+                customdata=prev_grouped['period_label'],
+                hovertemplate='<b>%{customdata}</b><br>Revenue: $%{y:,.0f}<extra></extra>'
+            ))
     
     fig.update_layout(
         title=f"Revenue Trend Comparison {title_suffix}",
@@ -306,7 +409,7 @@ def create_category_chart(product_metrics):
                 colorscale='Blues',
                 showscale=False
             ),
-            text=[format_currency(x) for x in top_categories['total_revenue']],
+            text=format_currency_vec(top_categories['total_revenue']),
             textposition='outside'
         )
     ])
@@ -323,15 +426,15 @@ def create_category_chart(product_metrics):
 
 def create_state_map(geographic_metrics):
     """Create US choropleth map for revenue by state."""
-    state_data = geographic_metrics['state_metrics'].reset_index()
-    state_data.columns = ['state', 'total_revenue', 'orders', 'avg_order_value', 'revenue_share']
+    state_metrics = geographic_metrics['state_metrics']
+    states = state_metrics.index.to_numpy()
     
     fig = go.Figure(data=go.Choropleth(
-        locations=state_data['state'],
-        z=state_data['total_revenue'],
+        locations=states,
+        z=state_metrics['total_revenue'].to_numpy(),
         locationmode='USA-states',
         colorscale='Blues',
-        text=state_data['state'],
+        text=states,
         hovertemplate='<b>%{text}</b><br>Revenue: $%{z:,.0f}<extra></extra>',
         colorbar_title="Revenue ($)"
     ))
@@ -363,14 +466,15 @@ def create_satisfaction_delivery_chart(cx_metrics):
         )
         return fig
     
-    satisfaction_data = cx_metrics['satisfaction_by_delivery'].reset_index()
+    satisfaction_data = cx_metrics['satisfaction_by_delivery']
+    avg_scores = satisfaction_data['avg_review_score'].to_numpy()
     
     fig = go.Figure(data=[
         go.Bar(
-            x=satisfaction_data['delivery_bucket'],
-            y=satisfaction_data['avg_review_score'],
+            x=satisfaction_data.index.to_numpy(),
+            y=avg_scores,
             marker_color='#FF6B6B',
-            text=[f"{x:.2f}" for x in satisfaction_data['avg_review_score']],
+            text=['' if np.isnan(x) else f"{x:.2f}" for x in avg_scores],
             textposition='outside'
         )
     ])
@@ -432,22 +536,18 @@ def main():
         start_date = st.date_input("Start Date", value=datetime(2023, 1, 1))
     
     # Load data
-    current_data, prev_data, loader = load_dashboard_data(start_date, end_date)
+    current_data, prev_data = load_dashboard_data(start_date, end_date)
     
     if current_data is None:
         st.error("Failed to load data. Please check your data files.")
         return
     
     # Calculate metrics
-    current_calculator = BusinessMetricsCalculator(current_data)
-    prev_calculator = BusinessMetricsCalculator(prev_data)
-    
-    current_revenue_metrics = current_calculator.calculate_revenue_metrics()
-    prev_revenue_metrics = prev_calculator.calculate_revenue_metrics()
-    
-    product_metrics = current_calculator.calculate_product_metrics()
-    geographic_metrics = current_calculator.calculate_geographic_metrics()
-    cx_metrics = current_calculator.calculate_customer_experience_metrics()
+    current_revenue_metrics, product_metrics, geographic_metrics, cx_metrics = (
+        _period_metrics(current_data)
+    )
+    # The previous period only feeds the trend indicators
+    prev_revenue_metrics = _quick_totals(prev_data)
     
     # KPI Cards Row
     st.markdown('<div class="section-header">Key Performance Indicators</div>', 
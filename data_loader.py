@@ -5,12 +5,164 @@ This module handles loading, cleaning, and preprocessing of e-commerce data
 from multiple CSV files and provides a unified interface for analysis.
 """
 
+import importlib.util
+import os
 import pandas as pd
 import numpy as np
 from typing import Dict, Tuple, Optional
 from datetime import datetime
 
 
+# Source CSV file for each dataset
+FILE_MAPPING = {
+    'orders': 'orders_dataset.csv',
+    'order_items': 'order_items_dataset.csv',
+    'products': 'products_dataset.csv',
+    'customers': 'customers_dataset.csv',
+    'reviews': 'order_reviews_dataset.csv',
+    'payments': 'order_payments_dataset.csv'
+}
+
+# Columns stored as native timestamps in the Parquet copies
+DATE_COLUMNS = {
+    'orders': [
+        'order_purchase_timestamp', 'order_approved_at',
+        'order_delivered_carrier_date', 'order_delivered_customer_date',
+        'order_estimated_delivery_date'
+    ],
+    'order_items': ['shipping_limit_date'],
+    'reviews': ['review_creation_date', 'review_answer_timestamp']
+}
+
+# Timestamps in the source files are ISO 8601 with fractional seconds; an
+# explicit format avoids per-value format inference
+TIMESTAMP_FORMAT = 'ISO8601'
+
+# Nanoseconds per day, for integer arithmetic on datetime64[ns] values
+NS_PER_DAY = 86_400_000_000_000
+
+# Rows per chunk when streaming a CSV file into its Parquet copy
+CSV_CHUNK_ROWS = 200_000
+
+# Declared types of the remaining CSV columns, so every chunk of a streamed
+# conversion has the same schema however its nulls fall; integer columns are
+# nullable while reading and text columns stay strings even when all-null
+CSV_DTYPES = {
+    'orders': {
+        'order_id': 'string', 'customer_id': 'string'
+    },
+    'order_items': {
+        'order_id': 'string', 'order_item_id': 'Int64', 'product_id': 'string',
+        'seller_id': 'string', 'price': 'float64', 'freight_value': 'float64'
+    },
+    'products': {
+        'product_id': 'string', 'product_name_length': 'Int64',
+        'product_description_length': 'Int64', 'product_photos_qty': 'Int64',
+        'product_weight_g': 'Int64', 'product_length_cm': 'Int64',
+        'product_height_cm': 'Int64', 'product_width_cm': 'Int64'
+    },
+    'customers': {
+        'customer_id': 'string', 'customer_unique_id': 'string',
+        'customer_zip_code_prefix': 'Int64', 'customer_city': 'string'
+    },
+    'reviews': {
+        'review_id': 'string', 'order_id': 'string', 'review_score': 'Int64',
+        'review_comment_title': 'string', 'review_comment_message': 'string'
+    },
+    'payments': {
+        'order_id': 'string', 'payment_sequential': 'Int64',
+        'payment_installments': 'Int64', 'payment_value': 'float64'
+    }
+}
+
+# Low-cardinality string columns stored as categoricals (dictionary-encoded in
+# the Parquet copies)
+CATEGORY_COLUMNS = {
+    'orders': ['order_status'],
+    'products': ['product_category_name'],
+    'customers': ['customer_state'],
+    'payments': ['payment_type']
+}
+
+# Columns of each table carried into the master dataset; everything else is
+# dropped before joining so the merges don't copy unused payload
+MASTER_COLUMNS = {
+    'orders': [
+        'order_id', 'customer_id', 'order_status', 'order_purchase_timestamp',
+        'order_year', 'order_month', 'delivery_days'
+    ],
+    'order_items': [
+        'order_id', 'product_id', 'price', 'freight_value', 'total_item_value'
+    ],
+    'products': ['product_id', 'product_category_name', 'category_clean'],
+    'customers': ['customer_id', 'customer_city', 'customer_state'],
+    'reviews': ['order_id', 'review_score']
+}
+
+# Columns read from each source file: the MASTER_COLUMNS taken straight from
+# the file plus the inputs of derived ones (delivery days, item totals, the
+# latest review per order). Files not listed here are read in full
+LOAD_COLUMNS = {
+    'orders': [
+        'order_id', 'customer_id', 'order_status', 'order_purchase_timestamp',
+        'order_delivered_customer_date'
+    ],
+    'order_items': ['order_id', 'product_id', 'price', 'freight_value'],
+    'products': ['product_id', 'product_category_name'],
+    'customers': ['customer_id', 'customer_city', 'customer_state'],
+    'reviews': ['order_id', 'review_score', 'review_creation_date']
+}
+
+
+def _parquet_schema(key: str, columns: pd.Index, inferred: 'pa.Schema') -> 'pa.Schema':
+    """
+    Fixed Parquet schema for a dataset's CSV columns.
+    
+    Declared columns get their declared type; columns missing from the
+    declarations keep the type inferred from the first chunk. The schema
+    carries no pandas metadata, so reading the copy yields the same dtypes
+    as reading the CSV directly.
+    
+    Args:
+        key (str): Dataset name
+        columns (pd.Index): CSV column names
+        inferred (pa.Schema): Schema inferred from the first chunk
+        
+    Returns:
+        pa.Schema: Schema shared by every chunk of the file
+    """
+    import pyarrow as pa
+    
+    arrow_types = {'string': pa.string(), 'Int64': pa.int64(), 'float64': pa.float64()}
+    dtypes = CSV_DTYPES.get(key, {})
+    
+    fields = []
+    for col in columns:
+        if col in DATE_COLUMNS.get(key, []):
+            field_type = pa.timestamp('us')
+        elif col in CATEGORY_COLUMNS.get(key, []):
+            field_type = pa.dictionary(pa.int32(), pa.string())
+        elif col in dtypes:
+            field_type = arrow_types[dtypes[col]]
+        else:
+            field_type = inferred.field(col).type
+        fields.append(pa.field(col, field_type))
+    return pa.schema(fields)
+
+
+def _parse_timestamps(values: pd.Series) -> pd.Series:
+    """
+    Parse a timestamp column, coercing unparseable values to NaT.
+    
+    Args:
+        values (pd.Series): Raw timestamp values
+        
+    Returns:
+        pd.Series: Parsed timestamps
+    """
+    return pd.to_datetime(values, format=TIMESTAMP_FORMAT, errors='coerce', cache=True)
+
+
 class EcommerceDataLoader:
     """
     A class to handle loading and preprocessing of e-commerce data.
@@ -30,25 +182,99 @@ class EcommerceDataLoader:
         self.raw_data = {}
         self.processed_data = {}
         
+    def _maybe_convert_to_parquet(self, key: str, filename: str) -> Optional[str]:
+        """
+        Ensure an up-to-date Parquet copy of a CSV file exists.
+        
+        The copy stores timestamp columns as native timestamps and
+        low-cardinality strings dictionary-encoded, and is rebuilt whenever
+        the CSV is newer.
+        
+        Args:
+            key (str): Dataset name
+            filename (str): CSV file name within the data path
+            
+        Returns:
+            Optional[str]: Path to the Parquet file, or None if pyarrow is not
+                installed or the file could not be written
+        """
+        # pyarrow is optional; without it the CSV files are read directly
+        if importlib.util.find_spec('pyarrow') is None:
+            return None
+        
+        csv_path = f"{self.data_path}{filename}"
+        parquet_path = f"{os.path.splitext(csv_path)[0]}.parquet"
+        
+        if (os.path.exists(parquet_path) and
+                os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)):
+            return parquet_path
+        
+        # Stream the CSV in chunks so peak memory is bounded by the chunk size,
+        # writing to a temporary file that only replaces the copy once complete
+        tmp_path = f"{parquet_path}.tmp"
+        writer = None
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            chunks = pd.read_csv(
+                csv_path, chunksize=CSV_CHUNK_ROWS, dtype=CSV_DTYPES.get(key)
+            )
+            for chunk in chunks:
+                for col in DATE_COLUMNS.get(key, []):
+                    if col in chunk.columns:
+                        chunk[col] = _parse_timestamps(chunk[col])
+                
+                # Declared types fix the file schema; category columns are
+                # dictionary-encoded so they read back as categoricals
+                if writer is None:
+                    schema = _parquet_schema(
+                        key, chunk.columns,
+                        pa.Schema.from_pandas(chunk, preserve_index=False)
+                    )
+                    writer = pq.ParquetWriter(tmp_path, schema)
+                
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                writer.write_table(table.replace_schema_metadata(None))
+            
+            if writer is None:
+                return None
+            writer.close()
+            os.replace(tmp_path, parquet_path)
+        except (OSError, ImportError, ValueError, TypeError) as e:
+            print(f"Could not write Parquet copy of {filename}: {str(e)}")
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+        
+        return parquet_path
+    
     def load_raw_data(self) -> Dict[str, pd.DataFrame]:
         """
-        Load all CSV files into pandas DataFrames.
+        Load all datasets into pandas DataFrames.
+        
+        Each CSV file is converted once to a typed Parquet copy, which is read
+        on subsequent loads; the CSV is read directly if the copy cannot be written.
+        Only the LOAD_COLUMNS of each file are read, so unused columns never
+        enter memory.
         
         Returns:
             Dict[str, pd.DataFrame]: Dictionary containing all loaded datasets
         """
-        file_mapping = {
-            'orders': 'orders_dataset.csv',
-            'order_items': 'order_items_dataset.csv',
-            'products': 'products_dataset.csv',
-            'customers': 'customers_dataset.csv',
-            'reviews': 'order_reviews_dataset.csv',
-            'payments': 'order_payments_dataset.csv'
-        }
-        
-        for key, filename in file_mapping.items():
+        for key, filename in FILE_MAPPING.items():
             try:
-                self.raw_data[key] = pd.read_csv(f"{self.data_path}{filename}")
+                columns = LOAD_COLUMNS.get(key)
+                parquet_path = self._maybe_convert_to_parquet(key, filename)
+                if parquet_path is not None:
+                    self.raw_data[key] = pd.read_parquet(
+                        parquet_path, engine='pyarrow', columns=columns
+                    )
+                else:
+                    self.raw_data[key] = pd.read_csv(
+                        f"{self.data_path}{filename}", usecols=columns
+                    )
                 print(f"Loaded {key}: {len(self.raw_data[key])} records")
             except Exception as e:
                 print(f"Error loading {filename}: {str(e)}")
@@ -60,12 +286,15 @@ class EcommerceDataLoader:
         """
         Clean and transform the raw data for analysis.
         
+        Raw tables are moved out of ``raw_data`` and transformed in place, so
+        they are not held in memory twice.
+        
         Returns:
             Dict[str, pd.DataFrame]: Dictionary containing cleaned datasets
         """
         # Clean orders data
         if 'orders' in self.raw_data:
-            orders = self.raw_data['orders'].copy()
+            orders = self.raw_data.pop('orders')
             
             # Convert timestamp columns to datetime
             timestamp_cols = [
@@ -76,41 +305,49 @@ class EcommerceDataLoader:
             
             for col in timestamp_cols:
                 if col in orders.columns:
-                    orders[col] = pd.to_datetime(orders[col], errors='coerce')
+                    orders[col] = _parse_timestamps(orders[col])
             
             # Extract date components for analysis
             orders['order_year'] = orders['order_purchase_timestamp'].dt.year
             orders['order_month'] = orders['order_purchase_timestamp'].dt.month
             orders['order_date'] = orders['order_purchase_timestamp'].dt.date
             
-            # Calculate delivery time in days
-            orders['delivery_days'] = (
-                orders['order_delivered_customer_date'] - 
-                orders['order_purchase_timestamp']
-            ).dt.days
+            # Calculate delivery time in whole days with integer arithmetic on
+            # the nanosecond values, skipping the intermediate timedelta column
+            purchased = orders['order_purchase_timestamp'].to_numpy('datetime64[ns]')
+            delivered = orders['order_delivered_customer_date'].to_numpy('datetime64[ns]')
+            elapsed_days = (delivered.view('i8') - purchased.view('i8')) // NS_PER_DAY
+            
+            # Nullable int16: missing dates are masked rather than stored as float NaN
+            orders['delivery_days'] = pd.arrays.IntegerArray(
+                elapsed_days.astype(np.int16), np.isnat(purchased) | np.isnat(delivered)
+            )
             
             self.processed_data['orders'] = orders
         
         # Clean order items data
         if 'order_items' in self.raw_data:
-            order_items = self.raw_data['order_items'].copy()
+            order_items = self.raw_data.pop('order_items')
             
             # Convert shipping limit date
             if 'shipping_limit_date' in order_items.columns:
-                order_items['shipping_limit_date'] = pd.to_datetime(
-                    order_items['shipping_limit_date'], errors='coerce'
-                )
+                order_items['shipping_limit_date'] = _parse_timestamps(order_items['shipping_limit_date'])
             
             # Calculate total item value (price + freight)
             order_items['total_item_value'] = (
                 order_items['price'] + order_items['freight_value']
             )
             
+            # Single precision is ample for currency amounts and halves the
+            # bytes every downstream reduction reads
+            for col in ('price', 'freight_value', 'total_item_value'):
+                order_items[col] = order_items[col].astype(np.float32)
+            
             self.processed_data['order_items'] = order_items
         
         # Clean products data
         if 'products' in self.raw_data:
-            products = self.raw_data['products'].copy()
+            products = self.raw_data.pop('products')
             
             # Clean category names (replace underscores with spaces, title case)
             if 'product_category_name' in products.columns:
@@ -124,33 +361,63 @@ class EcommerceDataLoader:
         
         # Clean customers data
         if 'customers' in self.raw_data:
-            customers = self.raw_data['customers'].copy()
+            customers = self.raw_data.pop('customers')
             self.processed_data['customers'] = customers
         
         # Clean reviews data
         if 'reviews' in self.raw_data:
-            reviews = self.raw_data['reviews'].copy()
+            reviews = self.raw_data.pop('reviews')
             
             # Convert review dates
             if 'review_creation_date' in reviews.columns:
-                reviews['review_creation_date'] = pd.to_datetime(
-                    reviews['review_creation_date'], errors='coerce'
-                )
+                reviews['review_creation_date'] = _parse_timestamps(reviews['review_creation_date'])
             
             if 'review_answer_timestamp' in reviews.columns:
-                reviews['review_answer_timestamp'] = pd.to_datetime(
-                    reviews['review_answer_timestamp'], errors='coerce'
+                reviews['review_answer_timestamp'] = _parse_timestamps(reviews['review_answer_timestamp'])
+            
+            # Scores are 1-5; nullable Int8 keeps missing scores as NA
+            if 'review_score' in reviews.columns:
+                reviews['review_score'] = reviews['review_score'].astype('Int8')
+            
+            # Keep one review per order (the most recent) so joining reviews
+            # onto order items cannot duplicate item rows and inflate revenue
+            if 'review_creation_date' in reviews.columns:
+                reviews = reviews.sort_values(
+                    'review_creation_date', kind='stable', na_position='first'
                 )
+            reviews = reviews.drop_duplicates('order_id', keep='last')
             
             self.processed_data['reviews'] = reviews
         
         # Clean payments data
         if 'payments' in self.raw_data:
-            payments = self.raw_data['payments'].copy()
+            payments = self.raw_data.pop('payments')
             self.processed_data['payments'] = payments
         
+        # Store low-cardinality strings as categoricals so comparisons and
+        # groupbys work on integer codes (already the case for Parquet input)
+        for key, columns in CATEGORY_COLUMNS.items():
+            if key in self.processed_data:
+                df = self.processed_data[key]
+                for col in columns:
+                    if col in df.columns:
+                        df[col] = df[col].astype('category')
+        
         return self.processed_data
     
+    def _master_columns(self, name: str) -> pd.DataFrame:
+        """
+        Project a processed table onto the columns used by the master dataset.
+        
+        Args:
+            name (str): Dataset name
+            
+        Returns:
+            pd.DataFrame: Table restricted to its MASTER_COLUMNS entry
+        """
+        df = self.processed_data[name]
+        return df[[col for col in MASTER_COLUMNS[name] if col in df.columns]]
+    
     def create_master_dataset(self) -> pd.DataFrame:
         """
         Create a master dataset by joining all relevant tables.
@@ -163,38 +430,25 @@ class EcommerceDataLoader:
         
         # Start with orders and order_items
         master_df = pd.merge(
-            self.processed_data['orders'],
-            self.processed_data['order_items'],
+            self._master_columns('orders'),
+            self._master_columns('order_items'),
             on='order_id',
             how='inner'
         )
         
-        # Add product information
-        if 'products' in self.processed_data:
-            master_df = pd.merge(
-                master_df,
-                self.processed_data['products'],
-                on='product_id',
-                how='left'
-            )
+        # Add product, customer and review information. Each dimension has
+        # one row per key, so it is indexed by that key and joined against
+        # it, aligning on the index instead of hashing both sides as a merge would
+        for name, key in (('products', 'product_id'),
+                          ('customers', 'customer_id'),
+                          ('reviews', 'order_id')):
+            if name in self.processed_data:
+                dimension = self._master_columns(name).set_index(key)
+                master_df = master_df.join(dimension, on=key)
         
-        # Add customer information
-        if 'customers' in self.processed_data:
-            master_df = pd.merge(
-                master_df,
-                self.processed_data['customers'],
-                on='customer_id',
-                how='left'
-            )
-        
-        # Add review information
-        if 'reviews' in self.processed_data:
-            master_df = pd.merge(
-                master_df,
-                self.processed_data['reviews'][['order_id', 'review_score']],
-                on='order_id',
-                how='left'
-            )
+        # Sort by purchase time so date ranges are contiguous row slices
+        master_df.sort_values('order_purchase_timestamp', kind='stable', inplace=True)
+        master_df.reset_index(drop=True, inplace=True)
         
         return master_df
     
@@ -215,9 +469,15 @@ class EcommerceDataLoader:
             month (int, optional): Specific month to filter (requires year)
             
         Returns:
-            pd.DataFrame: Filtered dataset
+            pd.DataFrame: Filtered dataset. Without any filter this is a copy
+                of ``df``. A date range on a time-sorted dataset is returned
+                as an ``iloc`` row slice that shares its data with ``df``;
+                call ``.copy()`` on it before modifying values in place.
         """
-        filtered_df = df.copy()
+        if year is None and start_date is None and end_date is None:
+            return df.copy()
+        
+        filtered_df = df
         
         # Filter by specific year and month
         if year is not None:
@@ -228,6 +488,20 @@ class EcommerceDataLoader:
         
         # Filter by date range
         elif start_date is not None or end_date is not None:
+            timestamps = filtered_df['order_purchase_timestamp']
+            
+            # Sorted data (see create_master_dataset) is sliced by binary search
+            if timestamps.is_monotonic_increasing:
+                lo = (
+                    timestamps.searchsorted(pd.to_datetime(start_date), side='left')
+                    if start_date else 0
+                )
+                hi = (
+                    timestamps.searchsorted(pd.to_datetime(end_date), side='right')
+                    if end_date else len(filtered_df)
+                )
+                return filtered_df.iloc[lo:hi]
+            
             if start_date:
                 start_date = pd.to_datetime(start_date)
                 filtered_df = filtered_df[
@@ -242,6 +516,18 @@ class EcommerceDataLoader:
         
         return filtered_df
     
+    def clear_intermediate_data(self) -> None:
+        """
+        Release the processed tables once the master dataset is built.
+        
+        For callers that keep the loader alive after building the master
+        dataset (e.g. from load_and_prepare_data). Raw tables are already
+        moved out by clean_and_transform_data; get_data_summary reports
+        nothing afterwards.
+        """
+        self.raw_data.clear()
+        self.processed_data.clear()
+    
     def get_data_summary(self) -> Dict[str, Dict]:
         """
         Get summary statistics for all loaded datasets.
@@ -0,0 +1,105 @@
+"""
+Tests for the bincount-based reductions in business_metrics, checked against
+the plain pandas operations they replace.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from business_metrics import (
+    BusinessMetricsCalculator,
+    DELIVERY_BUCKET_LABELS,
+    _delivery_buckets,
+    _group_agg,
+    _top_k,
+)
+
+
+def test_group_agg_matches_groupby():
+    rng = np.random.default_rng(0)
+    keys = pd.Series(rng.choice(['SP', 'RJ', 'MG', None], size=200), name='customer_state')
+    values = pd.Series(rng.gamma(2.0, 50.0, size=200).astype(np.float32), name='price')
+
+    expected = (
+        values.astype(np.float64)
+        .groupby(keys, observed=True)
+        .agg(['sum', 'count', 'mean'])
+    )
+    result = _group_agg(keys, values)
+
+    pd.testing.assert_frame_equal(
+        result.sort_index(), expected.sort_index(), check_dtype=False
+    )
+
+
+@pytest.mark.parametrize('k', [0, 1, 3, 5, 12, 50])
+def test_top_k_breaks_ties_by_position(k):
+    values = np.array([5.0, 1.0, 5.0, 3.0, 5.0, 3.0, 0.0, 3.0, 5.0, 1.0, 2.0, 3.0])
+
+    expected = (
+        pd.Series(values)
+        .sort_values(ascending=False, kind='stable')
+        .head(k)
+        .index.to_numpy()
+    )
+
+    np.testing.assert_array_equal(_top_k(values, k), expected)
+
+
+def test_delivery_buckets_match_cut():
+    days = np.array([-4.0, -1.0, 0.0, 1.0, 3.0, 3.5, 4.0, 7.0, 8.0, 14.0, 15.0, 30.0, 31.0, 120.0])
+
+    expected = pd.cut(
+        days, bins=[0, 3, 7, 14, 30, np.inf],
+        labels=DELIVERY_BUCKET_LABELS, include_lowest=True
+    )
+    result = _delivery_buckets(days)
+
+    assert list(result.categories) == DELIVERY_BUCKET_LABELS
+    assert result.ordered
+    np.testing.assert_array_equal(result.codes, expected.codes)
+
+
+def _master_frame():
+    """Small delivered-orders frame with unreviewed orders and negative delivery times."""
+    delivery_days = [2, 5, 5, -3, 10, 12, 1, np.nan, 20, 2]
+    review_score = [5, np.nan, 4, 1, 3, np.nan, 4, 5, 2, 3]
+    n_rows = len(delivery_days)
+    return pd.DataFrame({
+        'order_id': [f"o{i}" for i in range(n_rows)],
+        'product_id': [f"p{i % 3}" for i in range(n_rows)],
+        'order_status': ['delivered'] * (n_rows - 1) + ['canceled'],
+        'price': np.linspace(10.0, 100.0, n_rows),
+        'order_year': [2023] * n_rows,
+        'order_month': [1, 1, 2, 2, 3, 3, 4, 4, 5, 5],
+        'category_clean': ['toys', 'books'] * (n_rows // 2),
+        'customer_state': ['SP', 'RJ', 'MG', 'SP', 'RJ'] * (n_rows // 5),
+        'customer_city': ['sao paulo', 'rio', 'bh', 'sao paulo', 'rio'] * (n_rows // 5),
+        'delivery_days': delivery_days,
+        'review_score': review_score,
+    })
+
+
+def test_satisfaction_by_delivery_matches_groupby():
+    data = _master_frame()
+
+    delivered = data[(data['order_status'] == 'delivered') & data['delivery_days'].notna()]
+    buckets = pd.cut(
+        delivered['delivery_days'], bins=[0, 3, 7, 14, 30, np.inf],
+        labels=DELIVERY_BUCKET_LABELS, include_lowest=True
+    )
+    expected = (
+        delivered.groupby(buckets, observed=False)['review_score']
+        .agg(['mean', 'count'])
+        .rename(columns={'mean': 'avg_review_score', 'count': 'review_count'})
+    )
+    expected.index.name = 'delivery_bucket'
+
+    result = BusinessMetricsCalculator(data).calculate_customer_experience_metrics()
+    satisfaction = result['satisfaction_by_delivery']
+
+    # Empty buckets are still reported, with no average score
+    assert satisfaction.loc['30+ days', 'review_count'] == 0
+    assert np.isnan(satisfaction.loc['30+ days', 'avg_review_score'])
+    pd.testing.assert_frame_equal(satisfaction, expected, check_dtype=False)
@@ -0,0 +1,61 @@
+"""
+Tests for the cumulative revenue bins behind the dashboard trend chart.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('streamlit')
+
+from dashboard import TREND_FREQUENCIES, _bin_revenue, _revenue_bins
+
+
+def _master_frame(n_rows=300):
+    """Time-sorted master rows with a RangeIndex, as built by the data loader."""
+    rng = np.random.default_rng(1)
+    offsets = np.sort(rng.integers(0, 400 * 24 * 3600, size=n_rows))
+    return pd.DataFrame({
+        'order_purchase_timestamp': pd.Timestamp('2023-01-01') + pd.to_timedelta(offsets, unit='s'),
+        'order_status': rng.choice(['delivered', 'shipped', 'canceled'], size=n_rows, p=[0.8, 0.1, 0.1]),
+        'price': rng.gamma(2.0, 50.0, size=n_rows).astype(np.float32),
+    })
+
+
+def _reference_revenue(df, freq):
+    """Per-period delivered revenue of a slice computed directly from its rows."""
+    delivered = df[df['order_status'] == 'delivered']
+    grouped = (
+        delivered['price'].astype(np.float64)
+        .groupby(delivered['order_purchase_timestamp'].dt.to_period(freq))
+        .sum()
+        .reset_index()
+    )
+    return grouped[grouped['price'] > 0].reset_index(drop=True)
+
+
+@pytest.mark.parametrize('freq', TREND_FREQUENCIES)
+@pytest.mark.parametrize('lo, hi', [(0, 300), (0, 1), (17, 143), (101, 102), (250, 300)])
+def test_bin_revenue_matches_slice_groupby(freq, lo, hi):
+    master_df = _master_frame()
+    bins = _revenue_bins(master_df)
+
+    # Slices start and end mid-period, so the first and last periods are partial
+    df = master_df.iloc[lo:hi]
+    result = _bin_revenue(bins, df, freq)
+    expected = _reference_revenue(df, freq)
+
+    assert list(result['order_purchase_timestamp']) == list(expected['order_purchase_timestamp'])
+    np.testing.assert_allclose(result['price'].to_numpy(), expected['price'].to_numpy())
+
+
+def test_bin_revenue_rejects_non_contiguous_rows():
+    master_df = _master_frame()
+    bins = _revenue_bins(master_df)
+
+    masked = master_df[master_df['order_status'] == 'delivered']
+
+    with pytest.raises(ValueError):
+        _bin_revenue(bins, masked, 'M')
+    with pytest.raises(ValueError):
+        _bin_revenue(bins, master_df.iloc[:0], 'M')
@@ -0,0 +1,51 @@
+"""
+Tests for the streamed CSV to Parquet conversion in data_loader.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+import data_loader
+from data_loader import EcommerceDataLoader, FILE_MAPPING
+
+pytest.importorskip('pyarrow')
+
+
+def _write_reviews_csv(data_dir, n_rows):
+    """Reviews CSV whose nulls only appear after the first chunk."""
+    half = n_rows // 2
+    reviews = pd.DataFrame({
+        'review_id': [f"r{i}" for i in range(n_rows)],
+        'order_id': [f"o{i}" for i in range(n_rows)],
+        # Integers in the first chunk, gaps later
+        'review_score': [None if i >= half and i % 3 == 0 else i % 5 + 1
+                         for i in range(n_rows)],
+        # Text that is all-null in the first chunk
+        'review_comment_title': [None if i < half else f"title {i}"
+                                 for i in range(n_rows)],
+        'review_comment_message': [f"message {i}" for i in range(n_rows)],
+        'review_creation_date': ['2023-01-01 10:00:00.5'] * n_rows,
+        # Timestamps that are all-null in the first chunk
+        'review_answer_timestamp': [None if i < half else '2023-01-02 08:30:00'
+                                    for i in range(n_rows)],
+    })
+    reviews.to_csv(os.path.join(data_dir, FILE_MAPPING['reviews']), index=False)
+
+
+def test_streamed_parquet_copy_with_late_nulls(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, 'CSV_CHUNK_ROWS', 10)
+    _write_reviews_csv(tmp_path, 40)
+
+    loader = EcommerceDataLoader(f"{tmp_path}/")
+    parquet_path = loader._maybe_convert_to_parquet('reviews', FILE_MAPPING['reviews'])
+
+    assert parquet_path is not None
+    assert not os.path.exists(f"{parquet_path}.tmp")
+
+    # The copy reads back exactly as the parsed CSV does
+    expected = pd.read_csv(tmp_path / FILE_MAPPING['reviews'])
+    for col in data_loader.DATE_COLUMNS['reviews']:
+        expected[col] = data_loader._parse_timestamps(expected[col])
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), expected)